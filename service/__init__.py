@@ -4,6 +4,7 @@ from flask import Flask
 from flask_talisman import Talisman
 from flask_cors import CORS
 from service import config
+from service.common import log_handlers
 logging.basicConfig(
     level=logging.INFO,
     format="[%(asctime)s] [%(levelname)s] [%(module)s] %(message)s",
@@ -13,6 +14,12 @@ app = Flask(__name__)
 app.config["SQLALCHEMY_DATABASE_URI"] = config.DATABASE_URI
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = config.SQLALCHEMY_TRACK_MODIFICATIONS
 app.logger.setLevel(logging.INFO)
+if config.LOG_FORMAT == "json":
+    log_handlers.init_logging(
+        app,
+        log_handlers.parse_sample_rates(config.LOG_SAMPLE_RATES),
+        config.LOG_SAMPLE_RATE,
+    )
 app.logger.info("Customer Accounts Service starting...")
 talisman = Talisman(app, force_https=False)
 CORS(app)
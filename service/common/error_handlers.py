@@ -5,6 +5,7 @@ Flask error handlers for the Customer Accounts service
 import logging
 from flask import jsonify
 from service import app
+from service.models import DataValidationError
 from service.common.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_405_METHOD_NOT_ALLOWED,
@@ -19,6 +20,21 @@ logger = logging.getLogger("flask.app")
 ######################################################################
 
 
+@app.errorhandler(DataValidationError)
+def request_validation_error(error):
+    """Handle a DataValidationError with its per-field errors"""
+    app.logger.warning("Invalid request data: %s", error)
+    return (
+        jsonify(
+            status=400,
+            error="Bad Request",
+            message=str(error),
+            errors=error.errors,
+        ),
+        HTTP_400_BAD_REQUEST,
+    )
+
+
 @app.errorhandler(HTTP_405_METHOD_NOT_ALLOWED)
 def method_not_allowed(error):
     """Handle 405 Method Not Allowed"""
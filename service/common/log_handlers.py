@@ -0,0 +1,179 @@
+"""
+Module: log_handlers
+Structured, sampled, non-blocking request logging
+
+In JSON mode every log record is handed to a QueueHandler on the request
+thread and written by a QueueListener on a background thread. Each request
+gets a request id and a duration, and records below WARNING are sampled per
+route (Flask endpoint name) so that the happy path stays cheap. Warnings and
+errors are always logged in full.
+"""
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import re
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, has_request_context, request
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Client-supplied request ids are only trusted if they look like this
+REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+# Attributes every LogRecord has; anything else was passed via extra={...}
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+######################################################################
+# Formatter and Filter
+######################################################################
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a LogRecord as a single line of JSON"""
+
+    def format(self, record):
+        entry = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "module": record.module,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        for key, value in vars(record).items():
+            if key not in _RESERVED:
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps the message and traceback in separate fields"""
+
+    def prepare(self, record):
+        # The default prepare() folds the traceback into msg; keep it in
+        # exc_text instead and drop exc_info, which cannot cross the queue
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class SamplingFilter(logging.Filter):
+    """Drop unsampled request records below WARNING and tag the rest with the request id"""
+
+    def filter(self, record):
+        if not has_request_context():
+            return True
+        if record.levelno < logging.WARNING and not g.get("log_sampled", True):
+            return False
+        record.request_id = g.get("request_id")
+        return True
+
+
+######################################################################
+# Initialisation
+######################################################################
+
+
+def parse_sample_rates(value: str) -> dict:
+    """Parse "endpoint=rate,endpoint=rate" into a dict of floats."""
+    rates = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        endpoint, _, rate = item.partition("=")
+        rates[endpoint.strip()] = float(rate)
+    return rates
+
+
+def _request_id():
+    """Return the client's request id if it is well formed, else a new one."""
+    request_id = request.headers.get(REQUEST_ID_HEADER)
+    if request_id and REQUEST_ID_PATTERN.fullmatch(request_id):
+        return request_id
+    return uuid.uuid4().hex
+
+
+def _stop_listener(listener):
+    """Stop the listener at exit unless it has already been stopped."""
+    if listener._thread is not None:  # pylint: disable=protected-access
+        listener.stop()
+
+
+def init_logging(app, sample_rates=None, default_rate=1.0, stream=None):
+    """
+    Switch the root logger to structured JSON written on a background thread.
+
+    Parameters
+    ----------
+    app : Flask
+        The application whose requests are timed and sampled.
+    sample_rates : dict
+        Fraction of requests (0.0 - 1.0) to log below WARNING, by endpoint.
+    default_rate : float
+        Sampling rate for endpoints not listed in sample_rates.
+    stream :
+        Where the listener writes; defaults to sys.stderr.
+
+    Returns the started QueueListener.
+    """
+    sample_rates = sample_rates or {}
+
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    listener.start()
+    atexit.register(_stop_listener, listener)
+
+    @app.before_request
+    def start_request_log():
+        g.request_id = _request_id()
+        g.log_sampled = random.random() < sample_rates.get(request.endpoint, default_rate)
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def finish_request_log(response):
+        if "request_start" not in g:
+            return response  # an earlier before_request hook short-circuited
+        duration_ms = (time.perf_counter() - g.request_start) * 1000
+        level = logging.ERROR if response.status_code >= 500 else logging.INFO
+        app.logger.log(
+            level,
+            "%s %s %s",
+            request.method,
+            request.path,
+            response.status_code,
+            extra={
+                "route": request.endpoint,
+                "status": response.status_code,
+                "duration_ms": round(duration_ms, 3),
+            },
+        )
+        response.headers[REQUEST_ID_HEADER] = g.request_id
+        return response
+
+    return listener
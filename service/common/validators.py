@@ -0,0 +1,101 @@
+"""
+Module: validators
+Schema-compiled payload validators for SQLAlchemy models
+
+A validator is built once from a model's column definitions (type, max
+length, nullability and an optional ``info={"format": ...}`` hint) so that
+bad payloads are rejected before any database session work is done.
+"""
+import re
+from sqlalchemy import Integer, String
+
+# Format hints that may be attached to a column via info={"format": ...};
+# they are applied with fullmatch() so the whole value must match
+FORMATS = {
+    "email": re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+"),
+    "phone": re.compile(r"[0-9+()\-. xX]*[0-9][0-9+()\-. xX]*"),
+}
+
+
+######################################################################
+# Field checks
+######################################################################
+
+
+def _compile_field(column):
+    """Return a function that checks one value and returns an error or None."""
+    python_type = None
+    max_length = None
+    if isinstance(column.type, String):
+        python_type = str
+        max_length = column.type.length
+    elif isinstance(column.type, Integer):
+        python_type = int
+    pattern = FORMATS.get(column.info.get("format"))
+    nullable = column.nullable
+
+    def check(value):
+        if value is None:
+            return None if nullable else "must not be null"
+        if python_type is not None and (
+            not isinstance(value, python_type) or isinstance(value, bool)
+        ):
+            return f"must be of type {python_type.__name__}"
+        if max_length is not None and len(value) > max_length:
+            return f"must be at most {max_length} characters"
+        if pattern is not None and not pattern.fullmatch(value):
+            return f"is not a valid {column.info['format']}"
+        return None
+
+    return check
+
+
+######################################################################
+# Schema Validator
+######################################################################
+
+
+class SchemaValidator:
+    """
+    Validates dict payloads against a model's column definitions
+
+    Errors are returned as a dict mapping field name to message; an
+    empty dict means the payload is valid.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.checks = [
+            (column.name, _compile_field(column))
+            for column in model.__table__.columns
+            if not column.primary_key
+        ]
+
+    def validate(self, data) -> dict:
+        """Return the per-field errors for a single payload."""
+        if not isinstance(data, dict):
+            return {"__all__": "body of request contained bad or no data"}
+        errors = {}
+        for name, check in self.checks:
+            if name not in data:
+                errors[name] = "missing field"
+                continue
+            message = check(data[name])
+            if message:
+                errors[name] = message
+        return errors
+
+    def validate_many(self, items) -> dict:
+        """
+        Return the per-field errors of every invalid payload, keyed by list index.
+
+        Raises TypeError if items is not a list.
+        """
+        if not isinstance(items, list):
+            raise TypeError("body of request must be a list")
+        errors = {}
+        for index, data in enumerate(items):
+            item_errors = self.validate(data)
+            if item_errors:
+                errors[index] = item_errors
+        return errors
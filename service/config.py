@@ -14,3 +14,11 @@ DATABASE_URI = os.getenv(
 TESTING_DATABASE_URI = "sqlite:///:memory:"
 
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+# Logging: "text" writes inline on the request thread, "json" writes
+# structured records from a background thread with per-route sampling
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+
+# Fraction of requests logged below WARNING, e.g. "list_accounts=0.1,health=0"
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
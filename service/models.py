@@ -4,6 +4,7 @@ SQLAlchemy ORM model for Customer Accounts
 """
 import logging
 from flask_sqlalchemy import SQLAlchemy
+from service.common.validators import SchemaValidator
 
 logger = logging.getLogger("flask.app")
 
@@ -34,6 +35,10 @@ def init_db(app):
 class DataValidationError(Exception):
     """Raised when invalid data is passed to deserialize()"""
 
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or {}
+
 
 class Account(db.Model):
     """
@@ -52,9 +57,9 @@ class Account(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(64), nullable=False)
-    email = db.Column(db.String(64), nullable=False)
+    email = db.Column(db.String(64), nullable=False, info={"format": "email"})
     address = db.Column(db.String(256), nullable=False)
-    phone_number = db.Column(db.String(32), nullable=False)
+    phone_number = db.Column(db.String(32), nullable=False, info={"format": "phone"})
 
     # ------------------------------------------------------------------
     # Representation
@@ -89,24 +94,36 @@ class Account(db.Model):
         Raises
         ------
         DataValidationError
-            If any required field is missing or the data argument is not a dict.
+            If the data argument is not a dict or any field is missing,
+            of the wrong type, too long for its column or badly formatted.
         """
-        try:
-            self.name = data["name"]
-            self.email = data["email"]
-            self.address = data["address"]
-            self.phone_number = data["phone_number"]
-        except AttributeError as error:
-            raise DataValidationError(
-                "Invalid Account: body of request contained bad or no data — "
-                "Error message: " + str(error)
-            ) from error
-        except KeyError as error:
-            raise DataValidationError(
-                "Invalid Account: missing field — " + str(error)
-            ) from error
+        errors = _validator.validate(data)
+        if errors:
+            raise DataValidationError(_format_errors(errors), errors)
+        self.name = data["name"]
+        self.email = data["email"]
+        self.address = data["address"]
+        self.phone_number = data["phone_number"]
         return self
 
+    @classmethod
+    def validate_many(cls, items: list) -> dict:
+        """
+        Validate a list of account payloads without touching the database.
+
+        Returns a dict mapping the index of every invalid payload to its
+        per-field errors; an empty dict means every payload is valid.
+
+        Raises
+        ------
+        DataValidationError
+            If items is not a list.
+        """
+        try:
+            return _validator.validate_many(items)
+        except TypeError as error:
+            raise DataValidationError("Invalid Account list: " + str(error)) from error
+
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
@@ -146,3 +163,16 @@ class Account(db.Model):
         """Find a single Account by primary key."""
         logger.debug("Fetching account with id=%s", account_id)
         return cls.query.get(account_id)
+
+
+# Compiled once from the column definitions above
+_validator = SchemaValidator(Account)
+
+
+def _format_errors(errors: dict) -> str:
+    """Render per-field errors as a single DataValidationError message."""
+    details = "; ".join(
+        message if field == "__all__" else f"{field}: {message}"
+        for field, message in errors.items()
+    )
+    return "Invalid Account: " + details
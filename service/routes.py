@@ -5,13 +5,12 @@ RESTful API routes for the Customer Accounts service
 import logging
 from flask import jsonify, request, abort
 from service import app
-from service.models import Account, DataValidationError
+from service.models import Account
 from service.common.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
     HTTP_404_NOT_FOUND,
-    HTTP_400_BAD_REQUEST,
 )
 
 logger = logging.getLogger("flask.app")
@@ -60,10 +59,7 @@ def create_accounts():
     check_content_type("application/json")
     account = Account()
 
-    try:
-        account.deserialize(request.get_json())
-    except DataValidationError as error:
-        abort(HTTP_400_BAD_REQUEST, str(error))
+    account.deserialize(request.get_json())
 
     account.create()
 
@@ -133,10 +129,7 @@ def update_accounts(account_id):
         abort(HTTP_404_NOT_FOUND, f"Account with id [{account_id}] could not be found.")
 
     check_content_type("application/json")
-    try:
-        account.deserialize(request.get_json())
-    except DataValidationError as error:
-        abort(HTTP_400_BAD_REQUEST, str(error))
+    account.deserialize(request.get_json())
 
     account.update()
 
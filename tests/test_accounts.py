@@ -21,7 +21,7 @@ from unittest import TestCase
 os.environ["DATABASE_URI"] = "sqlite:///:memory:"
 
 from service import app, talisman  # noqa: E402
-from service.models import db, Account  # noqa: E402
+from service.models import db, Account, DataValidationError  # noqa: E402
 from service.common import status  # noqa: E402
 from tests.factories import AccountFactory  # noqa: E402
 
@@ -166,6 +166,63 @@ class TestAccountService(TestCase):
         response = self.client.delete(f"{BASE_URL}/{account.id}")
         self.assertEqual(response.status_code, 204)
 
+    def test_create_account_missing_field(self):
+        """It should not Create an Account with a missing field"""
+        data = AccountFactory().serialize()
+        del data["email"]
+        response = self.client.post(BASE_URL, json=data, content_type=CONTENT_TYPE_JSON)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email: missing field", response.get_json()["message"])
+
+    def test_create_account_bad_data(self):
+        """It should not Create an Account with bad field values"""
+        data = AccountFactory().serialize()
+        data["name"] = "x" * 65
+        data["email"] = "not-an-email"
+        response = self.client.post(BASE_URL, json=data, content_type=CONTENT_TYPE_JSON)
+        self.assertEqual(response.status_code, 400)
+        message = response.get_json()["message"]
+        self.assertIn("name: must be at most 64 characters", message)
+        self.assertIn("email: is not a valid email", message)
+        self.assertEqual(
+            response.get_json()["errors"],
+            {"name": "must be at most 64 characters", "email": "is not a valid email"},
+        )
+        self.assertEqual(Account.all(), [])
+
+    def test_create_account_trailing_newline(self):
+        """It should not Create an Account whose email or phone ends in a newline"""
+        data = AccountFactory().serialize()
+        data["email"] = "a@b.co\n"
+        data["phone_number"] = "5\n\n\n"
+        response = self.client.post(BASE_URL, json=data, content_type=CONTENT_TYPE_JSON)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()["errors"],
+            {"email": "is not a valid email", "phone_number": "is not a valid phone"},
+        )
+
+    def test_deserialize_bad_data(self):
+        """It should report structured errors when deserializing bad data"""
+        data = AccountFactory().serialize()
+        data["address"] = 42
+        data["phone_number"] = "call me"
+        with self.assertRaises(DataValidationError) as context:
+            Account().deserialize(data)
+        self.assertEqual(
+            context.exception.errors,
+            {"address": "must be of type str", "phone_number": "is not a valid phone"},
+        )
+        self.assertRaises(DataValidationError, Account().deserialize, "not a dict")
+
+    def test_validate_many(self):
+        """It should validate a list of Account payloads"""
+        good = AccountFactory().serialize()
+        bad = dict(good, name=None)
+        self.assertEqual(Account.validate_many([good, good]), {})
+        self.assertEqual(Account.validate_many([good, bad]), {1: {"name": "must not be null"}})
+        self.assertRaises(DataValidationError, Account.validate_many, good)
+
     def test_method_not_allowed(self):
         """It should not allow an illegal method call"""
         # DELETE on the collection URL is not routed → 405
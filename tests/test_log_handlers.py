@@ -0,0 +1,167 @@
+"""
+Test Cases for structured, sampled request logging
+
+Test cases can be run with:
+    nosetests
+    coverage report -m
+"""
+import io
+import json
+import logging
+import os
+import unittest
+from unittest import TestCase
+from flask import Flask
+
+# Importing the service package initialises the database; keep it in memory
+os.environ["DATABASE_URI"] = "sqlite:///:memory:"
+
+from service.common import log_handlers  # noqa: E402
+
+
+######################################################################
+# L O G   H A N D L E R   T E S T   C A S E S
+######################################################################
+
+
+class TestLogHandlers(TestCase):
+    """Structured Logging Tests"""
+
+    def setUp(self):
+        """Route the root logger through a fresh JSON listener"""
+        self.root_handlers = logging.getLogger().handlers[:]
+        self.disabled = logging.root.manager.disable
+        logging.disable(logging.NOTSET)
+        self.stream = io.StringIO()
+        self.listener = None
+        self.client = self._make_client({"quiet": 0.0}, 1.0)
+
+    def tearDown(self):
+        """Stop the listener and restore the original root handlers"""
+        self._stop_listener()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in self.root_handlers:
+            root.addHandler(handler)
+        logging.disable(self.disabled)
+
+    # ------------------------------------------------------------------
+    # H E L P E R S
+    # ------------------------------------------------------------------
+
+    def _make_client(self, sample_rates, default_rate):
+        """Build a small app logging through a JSON listener"""
+        self._stop_listener()
+        self.app = Flask(__name__)
+        self.app.logger.setLevel(logging.INFO)
+
+        @self.app.route("/ok")
+        def ok():
+            self.app.logger.info("handled ok")
+            return "", 200
+
+        @self.app.route("/quiet")
+        def quiet():
+            self.app.logger.info("handled quietly")
+            return "", 200
+
+        @self.app.route("/crash")
+        def crash():
+            try:
+                raise ValueError("bad value")
+            except ValueError:
+                self.app.logger.exception("it crashed")
+            return "", 500
+
+        @self.app.route("/boom")
+        def boom():
+            self.app.logger.error("it broke")
+            return "", 500
+
+        self.listener = log_handlers.init_logging(
+            self.app, sample_rates, default_rate, stream=self.stream
+        )
+        return self.app.test_client()
+
+    def _stop_listener(self):
+        """Flush and stop the listener, if one is running"""
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+
+    def _records(self):
+        """Flush the listener and return the JSON records written"""
+        self._stop_listener()
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    # ------------------------------------------------------------------
+    # T E S T   C A S E S
+    # ------------------------------------------------------------------
+
+    def test_parse_sample_rates(self):
+        """It should parse per-route sample rates"""
+        self.assertEqual(
+            log_handlers.parse_sample_rates("list_accounts=0.1, health=0"),
+            {"list_accounts": 0.1, "health": 0.0},
+        )
+        self.assertEqual(log_handlers.parse_sample_rates(""), {})
+
+    def test_request_is_logged_as_json(self):
+        """It should log JSON records with a request id and duration"""
+        response = self.client.get("/ok", headers={"X-Request-ID": "abc123"})
+        self.assertEqual(response.headers["X-Request-ID"], "abc123")
+        handled, summary = self._records()
+        self.assertEqual(handled["message"], "handled ok")
+        self.assertEqual(handled["request_id"], "abc123")
+        self.assertEqual(summary["route"], "ok")
+        self.assertEqual(summary["status"], 200)
+        self.assertEqual(summary["request_id"], "abc123")
+        self.assertIn("duration_ms", summary)
+
+    def test_request_id_is_generated(self):
+        """It should generate a request id when none is sent"""
+        response = self.client.get("/ok")
+        self.assertTrue(response.headers["X-Request-ID"])
+
+    def test_bad_request_id_is_replaced(self):
+        """It should not trust a malformed or oversized request id"""
+        for bad_id in ["<script>", "a b", "x" * 65]:
+            response = self.client.get("/ok", headers={"X-Request-ID": bad_id})
+            request_id = response.headers["X-Request-ID"]
+            self.assertNotEqual(request_id, bad_id)
+            self.assertRegex(request_id, r"^[0-9a-f]{32}$")
+
+    def test_unsampled_route_is_dropped(self):
+        """It should drop info records for an unsampled route"""
+        self.client.get("/quiet")
+        self.assertEqual(self._records(), [])
+
+    def test_errors_are_always_logged(self):
+        """It should always log errors, even when unsampled"""
+        client = self._make_client({}, 0.0)
+        client.get("/boom")
+        levels = [(record["level"], record["message"]) for record in self._records()]
+        self.assertEqual(levels, [("ERROR", "it broke"), ("ERROR", "GET /boom 500")])
+
+    def test_exception_is_logged_separately(self):
+        """It should log the traceback in its own exception field"""
+        self.client.get("/crash")
+        crashed = self._records()[0]
+        self.assertEqual(crashed["message"], "it crashed")
+        self.assertIn("Traceback", crashed["exception"])
+        self.assertIn("ValueError: bad value", crashed["exception"])
+
+    def test_stopped_listener_is_safe_at_exit(self):
+        """It should not fail at exit when the listener was already stopped"""
+        listener = self.listener
+        self._stop_listener()
+        log_handlers._stop_listener(listener)  # pylint: disable=protected-access
+
+
+######################################################################
+# Entry point
+######################################################################
+
+if __name__ == "__main__":
+    unittest.main()